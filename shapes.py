@@ -223,11 +223,10 @@ class Enemy:
         self.health = 30
         self.max_health = 30
         self.color = RED
-        self.projectiles: List[Projectile] = []
         self.shoot_cooldown = 0
         self.value = 100  # Score value
 
-    def update(self, player: Player) -> None:
+    def update(self, player: Player, projectiles: List[Projectile]) -> None:
         dx = player.x - self.x
         dy = player.y - self.y
         dist = max(1, math.hypot(dx, dy))
@@ -263,11 +262,11 @@ class ShootingEnemy(Enemy):
         self.shoot_cooldown = 60
         self.value = 200
 
-    def update(self, player: Player) -> None:
-        super().update(player)
+    def update(self, player: Player, projectiles: List[Projectile]) -> None:
+        super().update(player, projectiles)
         if self.shoot_cooldown <= 0:
             angle = math.degrees(math.atan2(player.y - self.y, player.x - self.x))
-            self.projectiles.append(Projectile(self.x, self.y, angle, speed=7, color=BLUE))
+            projectiles.append(Projectile(self.x, self.y, angle, speed=7, color=BLUE))
             self.shoot_cooldown = 60
 
 class BossEnemy(Enemy):
@@ -283,8 +282,8 @@ class BossEnemy(Enemy):
         self.value = 1000
         self.attack_pattern = 0
 
-    def update(self, player: Player) -> None:
-        super().update(player)
+    def update(self, player: Player, projectiles: List[Projectile]) -> None:
+        super().update(player, projectiles)
         
         # Change phase based on health
         self.phase = 3 if self.health < self.max_health * 0.3 else (
@@ -295,20 +294,20 @@ class BossEnemy(Enemy):
                 # Simple attack pattern
                 angle = math.degrees(math.atan2(player.y - self.y, player.x - self.x))
                 for offset in [-20, -10, 0, 10, 20]:
-                    self.projectiles.append(Projectile(self.x, self.y, angle + offset, 
-                                                     speed=6, color=PURPLE))
+                    projectiles.append(Projectile(self.x, self.y, angle + offset, 
+                                                speed=6, color=PURPLE))
             elif self.phase == 2:
                 # Spiral pattern
                 for i in range(8):
                     angle = (self.attack_pattern + i * 45) % 360
-                    self.projectiles.append(Projectile(self.x, self.y, angle, 
-                                                     speed=5, color=PURPLE))
+                    projectiles.append(Projectile(self.x, self.y, angle, 
+                                                speed=5, color=PURPLE))
                 self.attack_pattern = (self.attack_pattern + 20) % 360
             else:
                 # Desperate phase
                 for angle in range(0, 360, 30):
-                    self.projectiles.append(Projectile(self.x, self.y, angle, 
-                                                     speed=7, color=RED))
+                    projectiles.append(Projectile(self.x, self.y, angle, 
+                                                speed=7, color=RED))
             
             self.shoot_cooldown = 60 if self.phase < 3 else 45
 
@@ -366,6 +365,7 @@ class Game:
         self.state = "menu"
         self.player = Player()
         self.enemies: List[Enemy] = []
+        self.enemy_projectiles: List[Projectile] = []
         self.power_ups: List[PowerUp] = []
         self.wave = 0
         self.spawn_timer = 0
@@ -462,26 +462,26 @@ class Game:
             self.player.rotate(mouse_pos)
             self.player.update()
 
-            # Update enemies and their projectiles
-            for enemy in self.enemies[:]:
-                enemy.update(self.player)
-                
-                # Update enemy projectiles
-                for proj in enemy.projectiles[:]:
-                    proj.update()
-                    if not (0 <= proj.x <= WIDTH and 0 <= proj.y <= HEIGHT):
-                        enemy.projectiles.remove(proj)
-                    elif math.hypot(proj.x - self.player.x, proj.y - self.player.y) < self.player.size + proj.size:
-                        if self.player.iframes <= 0:
-                            self.player.health -= 10
-                            self.player.iframes = 60
-                            self.combo_count = 0
-                            if self.player.health <= 0:
-                                self.state = "game_over"
-                                if self.player.score > self.high_score:
-                                    self.high_score = self.player.score
-                                    self.save_high_score()
-                        enemy.projectiles.remove(proj)
+            # Update enemies
+            for enemy in self.enemies:
+                enemy.update(self.player, self.enemy_projectiles)
+
+            # Update enemy projectiles
+            for proj in self.enemy_projectiles[:]:
+                proj.update()
+                if not (0 <= proj.x <= WIDTH and 0 <= proj.y <= HEIGHT):
+                    self.enemy_projectiles.remove(proj)
+                elif math.hypot(proj.x - self.player.x, proj.y - self.player.y) < self.player.size + proj.size:
+                    if self.player.iframes <= 0:
+                        self.player.health -= 10
+                        self.player.iframes = 60
+                        self.combo_count = 0
+                        if self.player.health <= 0:
+                            self.state = "game_over"
+                            if self.player.score > self.high_score:
+                                self.high_score = self.player.score
+                                self.save_high_score()
+                    self.enemy_projectiles.remove(proj)
 
             # Check player projectile collisions
             for proj in self.player.projectiles[:]:
@@ -545,8 +545,8 @@ class Game:
             
             for enemy in self.enemies:
                 enemy.draw(screen)
-                for proj in enemy.projectiles:
-                    proj.draw(screen)
+            for proj in self.enemy_projectiles:
+                proj.draw(screen)
             
             for power_up in self.power_ups:
                 power_up.draw(screen)